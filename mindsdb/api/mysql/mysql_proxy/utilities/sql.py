@@ -1,4 +1,6 @@
+import os
 import copy
+import threading
 
 import duckdb
 import numpy as np
@@ -7,13 +9,103 @@ from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 from mindsdb_sql.planner.utils import query_traversal
 from mindsdb_sql.parser.ast import (
-    Select, Identifier,
+    Select, Identifier, Star,
     Function, Constant
 )
 
 from mindsdb.utilities import log
 from mindsdb.utilities.json_encoder import CustomJSONEncoder
 
+_duckdb_local = threading.local()
+
+# both are stateless after creation and can be shared between calls
+_render = SqlalchemyRender('postgres')
+_json_encoder = CustomJSONEncoder()
+
+# text of queries which sqlalchemy render can't process, for them the strict render is not tried again
+_failback_queries = set()
+_FAILBACK_QUERIES_LIMIT = 1000
+
+# besides ints and bools, dtypes which duckdb returns as is
+_PASSTHROUGH_DTYPES = (np.dtype('float32'), np.dtype('float64'), np.dtype('datetime64[ns]'))
+
+
+def _get_duckdb_connection():
+    """ Return in-memory duckdb connection of the current thread, creating it on first use.
+        Connection is not reused across processes: it would not survive fork.
+    """
+    con = getattr(_duckdb_local, 'con', None)
+    if con is None or _duckdb_local.pid != os.getpid():
+        con = duckdb.connect(database=':memory:')
+        _duckdb_local.con = con
+        _duckdb_local.pid = os.getpid()
+    return con
+
+
+def _render_query(query_ast, query):
+    """ Render query to 'postgres' dialect.
+        If sqlalchemy render fails, the query is rendered by mindsdb_sql (failback).
+        Failed query strings are remembered and go directly to failback next time.
+
+        Args:
+            query_ast (mindsdb_sql.parser.ast.Select): query to render
+            query (mindsdb_sql.parser.ast.Select | str): original query, used as cache key if it is a string
+
+        Returns:
+            str
+    """
+    if isinstance(query, str) and query in _failback_queries:
+        # the same as render.get_string does on failback for 'postgres' dialect
+        return str(query_ast).replace('`', '')
+
+    try:
+        return _render.get_string(query_ast, with_failback=False)
+    except Exception as e:
+        log.logger.error(
+            f"Exception during query casting to 'postgres' dialect. Query: {str(query)}. Error: {e}"
+        )
+        query_str = _render.get_string(query_ast, with_failback=True)
+        # remember the query only if failback works for it: otherwise it has to keep raising
+        if isinstance(query, str):
+            if len(_failback_queries) >= _FAILBACK_QUERIES_LIMIT:
+                _failback_queries.clear()
+            _failback_queries.add(query)
+        return query_str
+
+
+def _is_select_all(query_ast):
+    """ Check if query is plain 'select * from table', which returns the table unchanged
+    """
+    return (
+        len(query_ast.targets) == 1
+        and isinstance(query_ast.targets[0], Star)
+        and not query_ast.distinct
+        and query_ast.where is None
+        and query_ast.group_by is None
+        and query_ast.having is None
+        and query_ast.order_by is None
+        and query_ast.limit is None
+        and query_ast.offset is None
+        and query_ast.cte is None
+        and query_ast.mode is None
+        and query_ast.using is None
+    )
+
+
+def _is_passthrough_frame(df):
+    """ Check if duckdb would return the frame's columns unchanged: only numeric, bool and
+        naive datetime64[ns] columns with unique string names. Object and extension columns
+        (strings, dates, nullable ints, ...) are converted by duckdb and have to go through it.
+    """
+    if len(df.columns) == 0 or not df.columns.is_unique:
+        return False
+    for name, col_dtype in df.dtypes.items():
+        if not isinstance(name, str) or not isinstance(col_dtype, np.dtype):
+            return False
+        if col_dtype.kind not in 'iub' and col_dtype not in _PASSTHROUGH_DTYPES:
+            return False
+    return True
+
 
 def query_df(df, query, session=None):
     """ Perform simple query ('select' from one table, without subqueries and joins) on DataFrame.
@@ -27,8 +119,10 @@ def query_df(df, query, session=None):
     """
 
     if isinstance(query, str):
+        # freshly parsed tree is not shared with the caller, no need to copy it
         query_ast = parse_sql(query, dialect='mysql')
     else:
+        # query_traversal below rewrites nodes and their parents in place
         query_ast = copy.deepcopy(query)
 
     if isinstance(query_ast, Select) is False \
@@ -68,47 +162,62 @@ def query_df(df, query, session=None):
     query_traversal(query_ast, adapt_query)
 
     # convert json columns
-    encoder = CustomJSONEncoder()
-
-    def _convert(v):
-        if isinstance(v, dict) or isinstance(v, list):
+    for column in json_columns:
+        # dicts and lists can only be stored in object columns
+        if df[column].dtype != object:
+            continue
+        values = df[column].to_numpy()
+        mask = np.fromiter(
+            (isinstance(v, (dict, list)) for v in values),
+            dtype=bool,
+            count=len(values)
+        )
+        if not mask.any():
+            continue
+        values = values.copy()
+        for i in np.flatnonzero(mask):
             try:
-                return encoder.encode(v)
+                values[i] = _json_encoder.encode(values[i])
             except Exception:
                 pass
-        return v
-    for column in json_columns:
-        df[column] = df[column].apply(_convert)
-
-    render = SqlalchemyRender('postgres')
-    try:
-        query_str = render.get_string(query_ast, with_failback=False)
-    except Exception as e:
-        log.logger.error(
-            f"Exception during query casting to 'postgres' dialect. Query: {str(query)}. Error: {e}"
-        )
-        query_str = render.get_string(query_ast, with_failback=True)
+        df[column] = values
 
     # workaround to prevent duckdb.TypeMismatchException
     if len(df) > 0 and table_name.lower() in ('models', 'predictors', 'models_versions'):
         if 'TRAINING_OPTIONS' in df.columns:
-            df = df.astype({'TRAINING_OPTIONS': 'string'})
-
-    con = duckdb.connect(database=':memory:')
-
-    con.register('df_table', df)
-    result_df = con.execute(query_str).fetchdf()
-    result_df = result_df.replace({np.nan: None})
-    description = con.description
-    con.unregister('df_table')
-    con.close()
-
-    new_column_names = {}
-    real_column_names = [x[0] for x in description]
-    for i, duck_column_name in enumerate(result_df.columns):
-        new_column_names[duck_column_name] = real_column_names[i]
-    result_df = result_df.rename(
-        new_column_names,
-        axis='columns'
-    )
+            # shallow copy: the column is replaced without copying the others or changing the caller's frame
+            df = df.copy(deep=False)
+            df['TRAINING_OPTIONS'] = df['TRAINING_OPTIONS'].astype('string')
+
+    if _is_select_all(query_ast) and _is_passthrough_frame(df):
+        # nothing to compute and nothing duckdb would convert: return the data as is
+        result_df = df.reset_index(drop=True)
+        description = None
+    else:
+        query_str = _render_query(query_ast, query)
+
+        con = _get_duckdb_connection()
+
+        con.register('df_table', df)
+        try:
+            result_df = con.execute(query_str).fetchdf()
+            description = con.description
+        finally:
+            con.unregister('df_table')
+
+    # NULLs are sent to the client as None: convert only the columns that contain them
+    null_mask = result_df.isna()
+    null_columns = result_df.columns[null_mask.any().to_numpy()]
+    if len(null_columns) > 0:
+        result_df[null_columns] = result_df[null_columns].astype(object).where(~null_mask[null_columns], None)
+
+    if description is not None:
+        new_column_names = {}
+        real_column_names = [x[0] for x in description]
+        for i, duck_column_name in enumerate(result_df.columns):
+            new_column_names[duck_column_name] = real_column_names[i]
+        result_df = result_df.rename(
+            new_column_names,
+            axis='columns'
+        )
     return result_df
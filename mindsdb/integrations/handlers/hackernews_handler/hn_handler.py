@@ -1,4 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from mindsdb.utilities import log
 from mindsdb.utilities.config import Config
@@ -12,11 +15,22 @@ class HackerNewsHandler(APIHandler):
     A class for handling connections and interactions with the Hacker News API.
     """
 
+    # The API only serves one item per request, so items are fetched concurrently.
+    MAX_THREAD_POOL_WORKERS = 32
+
     def __init__(self, name=None, **kwargs):
         super().__init__(name)
 
         self.base_url = 'https://hacker-news.firebaseio.com/v0'
 
+        # Keep-alive session shared by all item requests of this handler.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_THREAD_POOL_WORKERS,
+            pool_maxsize=self.MAX_THREAD_POOL_WORKERS
+        )
+        self.session.mount('https://', adapter)
+
         stories = StoriesTable(self)
         self._register_table('stories', stories)
 
@@ -45,30 +59,47 @@ class HackerNewsHandler(APIHandler):
             data_frame=df
         )
 
+    def get_top_story_ids(self, limit=None):
+        """Fetch ids of the top stories. With a limit, only the first ids are requested from the API."""
+        url = f'{self.base_url}/topstories.json'
+        # firebase query: return only the first `limit` entries of the list
+        params = {'orderBy': '"$key"', 'limitToFirst': limit} if limit else None
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        data = response.json()
+        if isinstance(data, dict) and 'error' in data:
+            raise Exception(f"Error fetching top stories from Hacker News: {data['error']}")
+
+        if isinstance(data, dict):
+            # filtered lists can be returned as {"index": id} objects
+            data = [data[key] for key in sorted(data, key=int)]
+        return data[:limit]
+
+    def get_item(self, item_id):
+        """Fetch a single item (story, comment, etc.) from the Hacker News API."""
+        response = self.session.get(f'{self.base_url}/item/{item_id}.json')
+        return response.json()
+
+    def get_items(self, item_ids):
+        """Fetch several items concurrently. Results keep the order of item_ids."""
+        item_ids = list(item_ids)
+        if len(item_ids) <= 1:
+            return [self.get_item(item_id) for item_id in item_ids]
+
+        max_workers = min(self.MAX_THREAD_POOL_WORKERS, len(item_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_item, item_ids))
+
     def call_hackernews_api(self, method_name: str = None, params: dict = None):
             if method_name == 'get_top_stories':
-                url = f'{self.base_url}/topstories.json'
-                response = requests.get(url)
-                data = response.json()
-                stories_data = []
-                for story_id in data:
-                    url = f'{self.base_url}/item/{story_id}.json'
-                    response = requests.get(url)
-                    story_data = response.json()
-                    stories_data.append(story_data)
+                data = self.get_top_story_ids()
+                stories_data = self.get_items(data)
                 df = pd.DataFrame(stories_data, columns=['id', 'time', 'title', 'url', 'score', 'descendants'])
             elif method_name == 'get_comments':
                 item_id = params.get('item_id')
-                url = f'{self.base_url}/item/{item_id}.json'
-                response = requests.get(url)
-                item_data = response.json()
-                if 'kids' in item_data:
-                    comments_data = []
-                    for comment_id in item_data['kids']:
-                        url = f'{self.base_url}/item/{comment_id}.json'
-                        response = requests.get(url)
-                        comment_data = response.json()
-                        comments_data.append(comment_data)
+                item_data = self.get_item(item_id)
+                if item_data is not None and 'kids' in item_data:
+                    comments_data = self.get_items(item_data['kids'])
                     df = pd.DataFrame(comments_data)
                 else:
                     df = pd.DataFrame()
@@ -3,7 +3,6 @@ from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb_sql.parser import ast
 from mindsdb.integrations.utilities.sql_utils import extract_comparison_conditions
 from typing import List, Tuple
-import requests
 
 
 class StoriesTable(APITable):
@@ -21,18 +20,21 @@ class StoriesTable(APITable):
         if query.limit is not None:
             limit = query.limit.value
 
-        # Call the Hacker News API to get the top stories
-        url = f'{hn_handler.base_url}/topstories.json'
-        response = requests.get(url)
-        data = response.json()
+        # Group the WHERE conditions by column: {column: [(op, value), ...]}
+        conditions = {}
+        for op, column, value in extract_comparison_conditions(query.where):
+            conditions.setdefault(column, []).append((op, value))
 
-        # Fetch the details of the top stories, up to the specified limit
-        stories_data = []
-        for story_id in data[:limit]:
-            url = f'{hn_handler.base_url}/item/{story_id}.json'
-            response = requests.get(url)
-            story_data = response.json()
-            stories_data.append(story_data)
+        # Stories requested by id are fetched directly, without scanning the top stories
+        story_ids = [int(value) for op, value in conditions.get('id', []) if op == '=']
+        if len(story_ids) > 0:
+            story_ids = list(dict.fromkeys(story_ids))[:limit]
+        else:
+            # Call the Hacker News API to get the top stories
+            story_ids = hn_handler.get_top_story_ids(limit)
+
+        # Fetch the details of the stories, up to the specified limit
+        stories_data = [story for story in hn_handler.get_items(story_ids) if story is not None]
 
         # Create a DataFrame from the fetched data
         df = pd.DataFrame(
@@ -41,16 +43,16 @@ class StoriesTable(APITable):
             )
 
         # Apply any WHERE clauses in the SQL query to the DataFrame
-        conditions = extract_comparison_conditions(query.where)
-        for condition in conditions:
-            if condition[0] == '=' and condition[1] == 'id':
-                df = df[df['id'] == int(condition[2])]
-            elif condition[0] == '>' and condition[1] == 'time':
-                timestamp = int(condition[2])
+        for op, value in conditions.get('id', []):
+            if op == '=':
+                df = df[df['id'] == int(value)]
+        for op, value in conditions.get('time', []):
+            if op == '>':
+                timestamp = int(value)
                 df = df[df['time'] > timestamp]
 
         # Filter the columns in the DataFrame according to the SQL query
-        self.filter_columns(df, query)
+        df = self.filter_columns(df, query)
 
         return df
 
@@ -67,16 +69,25 @@ class StoriesTable(APITable):
         Args:
             df (pandas.DataFrame): The DataFrame to filter.
             query (ast.Select): The SQL query to apply to the DataFrame.
+        Returns:
+            pandas.DataFrame: The filtered DataFrame.
         """
         columns = []
         for target in query.targets:
-            if isinstance(target, ast.Star):
-                columns = self.get_columns()
-                break
-            elif isinstance(target, ast.Identifier):
-                columns.append(target.value)
-        df = df[columns]
-        return df
+            if isinstance(target, ast.Identifier):
+                columns.append(target.parts[-1])
+            else:
+                # star or expression: all the columns are needed
+                return df
+
+        unknown_columns = [column for column in columns if column not in self.get_columns()]
+        if len(unknown_columns) > 0:
+            raise ValueError(f"Unknown columns: {', '.join(unknown_columns)}")
+
+        if len(columns) == 0 or columns == df.columns.tolist():
+            return df
+        # known columns can be absent from the API response, e.g. when there are no comments
+        return df.reindex(columns=columns)
 
 
 class CommentsTable(APITable):
@@ -95,11 +106,14 @@ class CommentsTable(APITable):
             limit = query.limit.value
 
         # Get the item ID from the SQL query
+        conditions = {}
+        for op, column, value in extract_comparison_conditions(query.where):
+            conditions.setdefault(column, []).append((op, value))
+
         item_id = None
-        conditions = extract_comparison_conditions(query.where)
-        for condition in conditions:
-            if condition[0] == '=' and condition[1] == 'item_id':
-                item_id = condition[2]
+        for op, value in conditions.get('item_id', []):
+            if op == '=':
+                item_id = value
 
         if item_id is None:
             raise ValueError('Item ID is missing in the SQL query')
@@ -110,7 +124,7 @@ class CommentsTable(APITable):
         # Fill NaN values with 'deleted'
         comments_df = comments_df.fillna('deleted')
         # Filter the columns to those specified in the SQL query
-        self.filter_columns(comments_df, query)
+        comments_df = self.filter_columns(comments_df, query)
 
         # Limit the number of results if necessary
         if limit is not None:
@@ -133,21 +147,30 @@ class CommentsTable(APITable):
             'type',
         ]
 
-    def filter_columns(self, result: pd.DataFrame, query: ast.Select = None) -> None:
+    def filter_columns(self, result: pd.DataFrame, query: ast.Select = None) -> pd.DataFrame:
         """Filter the columns of a DataFrame to those specified in an SQL query.
         Args:
             result (pandas.DataFrame): The DataFrame to filter.
             query (ast.Select): The SQL query containing the column names to filter on.
+        Returns:
+            pandas.DataFrame: The filtered DataFrame.
         """
         if query is None:
-            return
+            return result
 
         columns = []
         for target in query.targets:
-            if isinstance(target, ast.Star):
-                return
-            elif isinstance(target, ast.Identifier):
-                columns.append(target.value)
-
-        if len(columns) > 0:
-            result = result[columns]
+            if isinstance(target, ast.Identifier):
+                columns.append(target.parts[-1])
+            else:
+                # star or expression: all the columns are needed
+                return result
+
+        unknown_columns = [column for column in columns if column not in self.get_columns()]
+        if len(unknown_columns) > 0:
+            raise ValueError(f"Unknown columns: {', '.join(unknown_columns)}")
+
+        if len(columns) == 0 or columns == result.columns.tolist():
+            return result
+        # known columns can be absent from the API response, e.g. when there are no comments
+        return result.reindex(columns=columns)
@@ -0,0 +1,96 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import pandas as pd
+import requests
+from mindsdb_sql import parse_sql
+
+from ..hn_handler import HackerNewsHandler
+
+STORIES = {
+    1: {'id': 1, 'time': 100, 'title': 't1', 'url': 'u1', 'score': 10, 'descendants': 0},
+    2: {'id': 2, 'time': 200, 'title': 't2', 'url': 'u2', 'score': 20, 'descendants': 0},
+}
+
+
+class HackerNewsTablesTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.handler = HackerNewsHandler('test_hackernews_handler')
+
+    def select(self, table, sql):
+        return self.handler._tables[table].select(parse_sql(sql, dialect='mindsdb'))
+
+    @patch.object(HackerNewsHandler, 'get_items', side_effect=lambda ids: [STORIES.get(i) for i in ids])
+    @patch.object(HackerNewsHandler, 'get_top_story_ids', return_value=[1, 2, 3])
+    def test_select_stories(self, mock_top_story_ids, mock_get_items):
+        df = self.select('stories', 'select id, title from stories where time > 150')
+        assert df.columns.tolist() == ['id', 'title']
+        assert df['id'].tolist() == [2]
+
+        # unknown story id 3 is dropped
+        df = self.select('stories', 'select * from stories')
+        assert df['id'].tolist() == [1, 2]
+
+    @patch.object(HackerNewsHandler, 'get_items', side_effect=lambda ids: [STORIES.get(i) for i in ids])
+    @patch.object(HackerNewsHandler, 'get_top_story_ids')
+    def test_select_story_by_id(self, mock_top_story_ids, mock_get_items):
+        df = self.select('stories', 'select title from stories where id = 2')
+        assert df['title'].tolist() == ['t2']
+        mock_top_story_ids.assert_not_called()
+
+    @patch.object(HackerNewsHandler, 'get_items', side_effect=lambda ids: [STORIES.get(i) for i in ids])
+    @patch.object(HackerNewsHandler, 'get_top_story_ids', return_value=[1, 2])
+    def test_select_unknown_column(self, mock_top_story_ids, mock_get_items):
+        with self.assertRaises(ValueError):
+            self.select('stories', 'select nope from stories')
+
+    @patch.object(HackerNewsHandler, 'call_hackernews_api', return_value=pd.DataFrame())
+    def test_select_comments_without_comments(self, mock_call_api):
+        df = self.select('comments', 'select id, text from comments where item_id = 1')
+        assert df.columns.tolist() == ['id', 'text']
+        assert len(df) == 0
+
+        with self.assertRaises(ValueError):
+            self.select('comments', 'select nope from comments where item_id = 1')
+
+
+class TopStoryIdsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.handler = HackerNewsHandler('test_hackernews_handler')
+
+    def get_top_story_ids(self, data, limit=None, status_code=200):
+        response = MagicMock()
+        response.json.return_value = data
+        if status_code != 200:
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(f'{status_code} Error')
+        with patch.object(self.handler.session, 'get', return_value=response) as mock_get:
+            return self.handler.get_top_story_ids(limit), mock_get.call_args
+
+    def test_without_limit(self):
+        ids, call_args = self.get_top_story_ids([5, 4, 3, 2, 1])
+        assert ids == [5, 4, 3, 2, 1]
+        assert call_args.kwargs['params'] is None
+
+    def test_limit(self):
+        ids, call_args = self.get_top_story_ids([5, 4], limit=2)
+        assert ids == [5, 4]
+        assert call_args.args[0].endswith('/topstories.json')
+        assert call_args.kwargs['params'] == {'orderBy': '"$key"', 'limitToFirst': 2}
+
+        # the filtered list can come back as an object keyed by the list index
+        ids, _ = self.get_top_story_ids({'10': 1, '2': 3, '0': 5, '1': 4}, limit=4)
+        assert ids == [5, 4, 3, 1]
+
+    def test_errors(self):
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.get_top_story_ids(None, limit=2, status_code=503)
+        with self.assertRaisesRegex(Exception, 'Permission denied'):
+            self.get_top_story_ids({'error': 'Permission denied'}, limit=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
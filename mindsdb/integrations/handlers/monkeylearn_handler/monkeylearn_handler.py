@@ -52,17 +52,17 @@ class monkeylearnHandler(BaseMLEngine):
         if len(input_list) > 500:
             raise Exception("Classifier only supports 500 data elements in list")
         ml = MonkeyLearn(args['api_key'])
-        df_list = []
-        for text in input_list:
-            pred_dict = {}
-            classifier_response = ml.classifiers.classify(args['model_id'], [text])
-            for res_dict in classifier_response.body:
-                if res_dict.get("error") is True:
-                    raise Exception(res_dict["error_detail"])
-                pred_dict['classification'] = res_dict['classifications']
-                pred_dict['tag'] = res_dict['classifications'][0]['tag_name']
-                df_list.append(pd.DataFrame([pred_dict]))
-        pred_df = pd.concat(df_list)
+        # classify accepts a list of texts, so all rows are sent at once instead of one request per row
+        classifier_response = ml.classifiers.classify(args['model_id'], input_list.tolist())
+        records = []
+        for res_dict in classifier_response.body:
+            if res_dict.get("error") is True:
+                raise Exception(res_dict["error_detail"])
+            records.append({
+                'classification': res_dict['classifications'],
+                'tag': res_dict['classifications'][0]['tag_name']
+            })
+        pred_df = pd.DataFrame.from_records(records, columns=['classification', 'tag'])
         return pred_df
 
     def describe(self, attribute: Optional[str] = None) -> pd.DataFrame:
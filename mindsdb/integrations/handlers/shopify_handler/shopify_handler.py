@@ -2,6 +2,7 @@ import shopify
 import requests
 
 from mindsdb.integrations.handlers.shopify_handler.shopify_tables import ProductsTable, CustomersTable, OrdersTable, InventoryLevelTable, LocationTable, CustomerReviews, CarrierServiceTable
+from mindsdb.integrations.handlers.shopify_handler.shopify_tables import ResponseCache, yotpo_session, YOTPO_REQUEST_TIMEOUT
 from mindsdb.integrations.libs.api_handler import APIHandler
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
@@ -34,6 +35,9 @@ class ShopifyHandler(APIHandler):
         self.connection = None
         self.is_connected = False
 
+        # reuses responses of identical API requests made within a short time
+        self.response_cache = ResponseCache()
+
         products_data = ProductsTable(self)
         self._register_table("products", products_data)
 
@@ -77,6 +81,17 @@ class ShopifyHandler(APIHandler):
 
         return self.connection
 
+    def activate_session(self) -> None:
+        """
+        Activate the Shopify API session for the current thread.
+        The Shopify resources keep the active session per thread, so the activation is skipped if this thread already uses it.
+        """
+        api_session = self.connect()
+
+        resource = shopify.ShopifyResource
+        if resource.site != api_session.site or resource.headers.get('X-Shopify-Access-Token') != api_session.token:
+            resource.activate_session(api_session)
+
     def check_connection(self) -> StatusResponse:
         """
         Check connection to the handler.
@@ -87,8 +102,7 @@ class ShopifyHandler(APIHandler):
         response = StatusResponse(False)
 
         try:
-            api_session = self.connect()
-            shopify.ShopifyResource.activate_session(api_session)
+            self.activate_session()
             shopify.Shop.current()
             response.success = True
         except Exception as e:
@@ -97,13 +111,11 @@ class ShopifyHandler(APIHandler):
 
         if self.yotpo_app_key is not None and self.yotpo_access_token is not None:
             url = f"https://api.yotpo.com/v1/apps/{self.yotpo_app_key}/reviews?count=1&utoken={self.yotpo_access_token}"
-            headers = {
-                "accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            if requests.get(url, headers=headers).status_code == 200:
-                response.success = True
-            else:
+            try:
+                response.success = yotpo_session.get(url, timeout=YOTPO_REQUEST_TIMEOUT).status_code == 200
+            except requests.exceptions.RequestException as e:
+                log.logger.error('Error connecting to Yotpo!')
+                response.error_message = str(e)
                 response.success = False
 
         self.is_connected = response.success
@@ -1,7 +1,14 @@
+import time
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+
 import shopify
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from typing import Text, List, Dict, Any
+from typing import Text, List, Dict, Any, Callable
+from pyactiveresource.activeresource import ActiveResource
 
 from mindsdb_sql.parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
@@ -15,10 +22,228 @@ from mindsdb.utilities.log import get_log
 
 logger = get_log("integrations.shopify_handler")
 
+# Number of concurrent requests used for per-record write operations and Yotpo review pages.
+# Kept low because of the Shopify and Yotpo API rate limits.
+MAX_THREAD_POOL_WORKERS = 8
+
+# the largest page the Yotpo reviews endpoint returns
+YOTPO_REVIEWS_PAGE_SIZE = 100
+
+# seconds to wait for the Yotpo API to connect and to respond
+YOTPO_REQUEST_TIMEOUT = 10
+
+# keep-alive session for the Yotpo API, shared by all handler instances
+yotpo_session = requests.Session()
+yotpo_session.headers.update({
+    "accept": "application/json",
+    "Content-Type": "application/json"
+})
+# one pooled connection per concurrent worker, rate limited and failed requests are retried
+yotpo_session.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_THREAD_POOL_WORKERS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # the last response is returned instead of raising RetryError
+        raise_on_status=False
+    )
+))
+
+
+def where_conditions_to_api_params(where_conditions: List[List[Any]], supported_columns: List[Text]) -> Dict[Text, Any]:
+    """
+    Translates the WHERE conditions that the Shopify API can filter on into request parameters.
+    'id' conditions are sent as the 'ids' parameter, other supported columns only for '=' conditions.
+
+    The API filters only narrow down the response: the conditions still have to be applied to it afterwards.
+    """
+    params = {}
+    for op, column, value in where_conditions:
+        if column == 'id' and op in ('=', 'in'):
+            ids = value if op == 'in' else [value]
+            params['ids'] = ','.join(str(id_) for id_ in ids)
+        elif column in supported_columns and op == '=':
+            params[column] = value
+    return params
+
+
+def run_writes(handler, write: Callable[[Any], None], records: List[Any]) -> None:
+    """
+    Runs a per-record write operation for all the records on a thread pool.
+    The Shopify session is thread-local: it is activated once in each worker thread, not per record.
+
+    The response cache is cleared once the writes are done: cleared before, a select running meanwhile
+    could cache the old state again. Writes clear it before looking up their records for the same reason.
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_THREAD_POOL_WORKERS, initializer=handler.activate_session) as executor:
+            list(executor.map(write, records))
+    finally:
+        handler.response_cache.clear()
+
+
+def execute_select(df: pd.DataFrame, selected_columns: List[Text], where_conditions: List[List[Any]],
+                   order_by_conditions: Dict[Text, List[Any]]) -> pd.DataFrame:
+    """
+    Applies the parsed SELECT query to the data fetched from the API.
+    An empty response is returned right away: there is nothing to filter or sort.
+    """
+    if len(df) == 0:
+        return pd.DataFrame([], columns=selected_columns)
+
+    select_statement_executor = SELECTQueryExecutor(
+        df,
+        selected_columns,
+        where_conditions,
+        order_by_conditions
+    )
+    return select_statement_executor.execute_query()
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Converts a pyactiveresource object to plain Python values, like ActiveResource.to_dict() does.
+    The parsed attributes are converted in place instead of being copied: the resource objects
+    returned by find() are not used afterwards.
+    """
+    if isinstance(value, ActiveResource):
+        value = value.attributes
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (ActiveResource, dict, list)):
+                value[key] = to_plain(item)
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            if isinstance(item, (ActiveResource, dict, list)):
+                value[i] = to_plain(item)
+    return value
+
+
+def cached_find(handler, resource_cls: type, key: Text, **kwargs) -> List[Dict]:
+    """
+    Fetches the records of a Shopify resource as plain Python values, the keyword arguments are passed on to find().
+    The records are taken from the handler's response cache if they are there, otherwise they are cached under the key.
+    """
+    records = handler.response_cache.get(key)
+    if records is None:
+        handler.activate_session()
+        # find() returns one page, islice only stops at the limit if the pages are ever iterated through
+        records = resource_cls.find(**kwargs)
+        records = [to_plain(record) for record in islice(records, kwargs.get('limit'))]
+        handler.response_cache.set(key, records)
+    return records
+
+
+def _search_param_condition(op: Text, column: Text, value: Any,
+                            search_params: Dict, subset_where_conditions: List) -> None:
+    """Sends a WHERE condition to the API as a request parameter."""
+    if op != '=':
+        raise NotImplementedError(f"Only '=' operator is supported for {column} column.")
+    search_params[column] = value
+
+
+def _subset_condition(op: Text, column: Text, value: Any,
+                      search_params: Dict, subset_where_conditions: List) -> None:
+    """Keeps a WHERE condition to be applied to the API response."""
+    subset_where_conditions.append([op, column, value])
+
+
+class ResponseCache:
+    """
+    Short-lived in-memory cache of Shopify API responses, keyed by the requested resource and its parameters.
+
+    Parameters
+    ----------
+    ttl : int
+        Number of seconds a response is reused for.
+    max_size : int
+        Maximum number of responses to keep.
+    """
+
+    def __init__(self, ttl: int = 60, max_size: int = 128):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._responses = {}
+
+    @staticmethod
+    def make_key(resource: Text, params: Dict) -> Text:
+        return f'{resource}:{sorted(params.items())!r}'
+
+    def get(self, key: Text) -> Any:
+        entry = self._responses.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            self._responses.pop(key, None)
+            return None
+        return response
+
+    def set(self, key: Text, response: Any) -> None:
+        if len(self._responses) >= self.max_size:
+            now = time.monotonic()
+            for old_key, (expires_at, _) in list(self._responses.items()):
+                if expires_at < now:
+                    self._responses.pop(old_key, None)
+            if len(self._responses) >= self.max_size:
+                # drop the oldest response
+                self._responses.pop(next(iter(self._responses)), None)
+        self._responses[key] = (time.monotonic() + self.ttl, response)
+
+    def clear(self) -> None:
+        self._responses.clear()
+
+
+class ResponseColumnsTable(APITable):
+    """
+    Base of the tables whose columns are taken from the API response.
+    The columns are fetched on first use, then reused.
+    """
+
+    # name of the table in the queries
+    table_name = None
+    _columns = None
+
+    def select(self, query: ast.Select) -> pd.DataFrame:
+        # the limit is known before the columns: fetch the data first and take the columns from it
+        result_limit = SELECTQueryParser(query, self.table_name, []).parse_limit_clause()
+        df = self.records_to_df(self.get_records(limit=result_limit))
+        if len(df.columns) > 0:
+            self._columns = df.columns.tolist()
+
+        select_statement_parser = SELECTQueryParser(
+            query,
+            self.table_name,
+            self.get_columns()
+        )
+        selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
+
+        return execute_select(df, selected_columns, where_conditions, order_by_conditions)
+
+    def get_records(self, **kwargs) -> List[Dict]:
+        """Fetches the records of the table from the API, the keyword arguments are passed on as request parameters."""
+        raise NotImplementedError()
+
+    def records_to_df(self, records: List[Dict]) -> pd.DataFrame:
+        return pd.json_normalize(records)
 
-class ProductsTable(APITable):
+    def get_columns(self) -> List[Text]:
+        if self._columns is None:
+            columns = self.records_to_df(self.get_records(limit=1)).columns.tolist()
+            if len(columns) == 0:
+                # nothing to learn the columns from yet
+                return columns
+            self._columns = columns
+        return list(self._columns)
+
+
+class ProductsTable(ResponseColumnsTable):
     """The Shopify Products Table implementation"""
 
+    table_name = 'products'
+
     def select(self, query: ast.Select) -> pd.DataFrame:
         """Pulls data from the Shopify "GET /products" API endpoint.
 
@@ -37,25 +262,7 @@ class ProductsTable(APITable):
         ValueError
             If the query contains an unsupported condition
         """
-
-        select_statement_parser = SELECTQueryParser(
-            query,
-            'products',
-            self.get_columns()
-        )
-        selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
-
-        products_df = pd.json_normalize(self.get_products(limit=result_limit))
-
-        select_statement_executor = SELECTQueryExecutor(
-            products_df,
-            selected_columns,
-            where_conditions,
-            order_by_conditions
-        )
-        products_df = select_statement_executor.execute_query()
-
-        return products_df
+        return super().select(query)
     
     def insert(self, query: ast.Insert) -> None:
         """Inserts data into the Shopify "POST /products" API endpoint.
@@ -104,7 +311,15 @@ class ProductsTable(APITable):
         delete_statement_parser = DELETEQueryParser(query)
         where_conditions = delete_statement_parser.parse_query()
 
-        products_df = pd.json_normalize(self.get_products())
+        api_params = where_conditions_to_api_params(
+            where_conditions,
+            supported_columns=['title', 'vendor', 'product_type', 'handle', 'status']
+        )
+        self.handler.response_cache.clear()
+        products = self.get_products(**api_params)
+        if len(products) == 0:
+            return
+        products_df = pd.json_normalize(products)
 
         delete_query_executor = DELETEQueryExecutor(
             products_df,
@@ -116,40 +331,37 @@ class ProductsTable(APITable):
         product_ids = products_df['id'].tolist()
         self.delete_products(product_ids)
 
-    def get_columns(self) -> List[Text]:
-        return pd.json_normalize(self.get_products(limit=1)).columns.tolist()
+    def get_records(self, **kwargs) -> List[Dict]:
+        return self.get_products(**kwargs)
 
     def get_products(self, **kwargs) -> List[Dict]:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
-        products = shopify.Product.find(**kwargs)
-        return [product.to_dict() for product in products]
+        key = ResponseCache.make_key('products', kwargs)
+        return cached_find(self.handler, shopify.Product, key, **kwargs)
     
     def delete_products(self, product_ids: List[int]) -> None:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
-
-        for product_id in product_ids:
-            product = shopify.Product.find(product_id)
-            product.destroy()
-            logger.info(f'Product {product_id} deleted')
+        run_writes(self.handler, self.delete_product, product_ids)
 
+    def delete_product(self, product_id: int) -> None:
+        # the product is addressed by its id, there is no need to fetch it first
+        shopify.Product({'id': product_id}).destroy()
+        logger.info(f'Product {product_id} deleted')
 
     def create_products(self, product_data: List[Dict[Text, Any]]) -> None:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
+        run_writes(self.handler, self.create_product, product_data)
 
-        for product in product_data:
-            created_product = shopify.Product.create(product)
-            if 'id' not in created_product.to_dict():
-                raise Exception('Product creation failed')
-            else:
-                logger.info(f'Product {created_product.to_dict()["id"]} created')
+    def create_product(self, product: Dict[Text, Any]) -> None:
+        created_product = shopify.Product.create(product)
+        if 'id' not in created_product.to_dict():
+            raise Exception('Product creation failed')
+        else:
+            logger.info(f'Product {created_product.to_dict()["id"]} created')
 
 
-class CustomersTable(APITable):
+class CustomersTable(ResponseColumnsTable):
     """The Shopify Customers Table implementation"""
 
+    table_name = 'customers'
+
     def select(self, query: ast.Select) -> pd.DataFrame:
         """Pulls data from the Shopify "GET /customers" API endpoint.
 
@@ -168,24 +380,7 @@ class CustomersTable(APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        select_statement_parser = SELECTQueryParser(
-            query,
-            'customers',
-            self.get_columns()
-        )
-        selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
-
-        customers_df = pd.json_normalize(self.get_customers(limit=result_limit))
-
-        select_statement_executor = SELECTQueryExecutor(
-            customers_df,
-            selected_columns,
-            where_conditions,
-            order_by_conditions
-        )
-        customers_df = select_statement_executor.execute_query()
-
-        return customers_df
+        return super().select(query)
 
     def insert(self, query: ast.Insert) -> None:
         """Inserts data into the Shopify "POST /customers" API endpoint.
@@ -233,7 +428,13 @@ class CustomersTable(APITable):
         update_statement_parser = UPDATEQueryParser(query)
         values_to_update, where_conditions = update_statement_parser.parse_query()
 
-        customers_df = pd.json_normalize(self.get_customers())
+        # the customers endpoint can only filter on ids
+        api_params = where_conditions_to_api_params(where_conditions, supported_columns=[])
+        self.handler.response_cache.clear()
+        customers = self.get_customers(**api_params)
+        if len(customers) == 0:
+            return
+        customers_df = pd.json_normalize(customers)
 
         update_query_executor = UPDATEQueryExecutor(
             customers_df,
@@ -246,41 +447,44 @@ class CustomersTable(APITable):
 
         self.update_customers(customer_ids, values_to_update)
 
-    def get_columns(self) -> List[Text]:
-        return pd.json_normalize(self.get_customers(limit=1)).columns.tolist()
+    def get_records(self, **kwargs) -> List[Dict]:
+        return self.get_customers(**kwargs)
 
     def get_customers(self, **kwargs) -> List[Dict]:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
-        customers = shopify.Customer.find(**kwargs)
-        return [customer.to_dict() for customer in customers]
+        key = ResponseCache.make_key('customers', kwargs)
+        return cached_find(self.handler, shopify.Customer, key, **kwargs)
 
     def create_customers(self, customer_data: List[Dict[Text, Any]]) -> None:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
+        run_writes(self.handler, self.create_customer, customer_data)
 
-        for customer in customer_data:
-            created_customer = shopify.Customer.create(customer)
-            if 'id' not in created_customer.to_dict():
-                raise Exception('Customer creation failed')
-            else:
-                logger.info(f'Customer {created_customer.to_dict()["id"]} created')
+    def create_customer(self, customer: Dict[Text, Any]) -> None:
+        created_customer = shopify.Customer.create(customer)
+        if 'id' not in created_customer.to_dict():
+            raise Exception('Customer creation failed')
+        else:
+            logger.info(f'Customer {created_customer.to_dict()["id"]} created')
 
     def update_customers(self, customer_ids: List[int], values_to_update: List[Dict[Text, Any]]) -> None:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
+        run_writes(
+            self.handler,
+            lambda customer_id: self.update_customer(customer_id, values_to_update),
+            customer_ids
+        )
 
-        for customer_id in customer_ids:
-            customer = shopify.Customer.find(customer_id)
-            for key, value in values_to_update.items():
-                setattr(customer, key, value)
-            customer.save()
-            logger.info(f'Customer {customer_id} updated')
+    def update_customer(self, customer_id: int, values_to_update: Dict[Text, Any]) -> None:
+        # only the changed fields are sent, there is no need to fetch the customer first
+        customer = shopify.Customer({'id': customer_id})
+        for key, value in values_to_update.items():
+            setattr(customer, key, value)
+        customer.save()
+        logger.info(f'Customer {customer_id} updated')
 
 
-class OrdersTable(APITable):
+class OrdersTable(ResponseColumnsTable):
     """The Shopify Orders Table implementation"""
 
+    table_name = 'orders'
+
     def select(self, query: ast.Select) -> pd.DataFrame:
         """Pulls data from the Shopify "GET /orders" API endpoint.
 
@@ -299,36 +503,31 @@ class OrdersTable(APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        select_statement_parser = SELECTQueryParser(
-            query,
-            'orders',
-            self.get_columns()
-        )
-        selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
-        orders_df = pd.json_normalize(self.get_orders(limit=result_limit))
+        return super().select(query)
 
-        select_statement_executor = SELECTQueryExecutor(
-            orders_df,
-            selected_columns,
-            where_conditions,
-            order_by_conditions
-        )
-        orders_df = select_statement_executor.execute_query()
-
-        return orders_df
-
-    def get_columns(self) -> List[Text]:
-        return pd.json_normalize(self.get_orders(limit=1)).columns.tolist()
+    def get_records(self, **kwargs) -> List[Dict]:
+        return self.get_orders(**kwargs)
 
     def get_orders(self, **kwargs) -> List[Dict]:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
-        orders = shopify.Order.find(**kwargs)
-        return [order.to_dict() for order in orders]
+        key = ResponseCache.make_key('orders', kwargs)
+        return cached_find(self.handler, shopify.Order, key, **kwargs)
+
 
 class InventoryLevelTable(APITable):
     """The Shopify Inventory Table implementation"""
 
+    _COLUMNS = ("inventory_item_ids", "location_ids", "available", "updated_at")
+    # the API names the filtered columns in singular
+    _RESPONSE_COLUMNS = ("inventory_item_id", "location_id", "available", "updated_at")
+
+    # how a WHERE condition on each column is handled, conditions on other columns are ignored
+    where_condition_handlers = {
+        'inventory_item_ids': _search_param_condition,
+        'location_ids': _search_param_condition,
+        'available': _subset_condition,
+        'updated_at': _subset_condition
+    }
+
     def select(self, query: ast.Select) -> pd.DataFrame:
         """Pulls data from the Shopify "GET /inventory" API endpoint.
 
@@ -358,18 +557,9 @@ class InventoryLevelTable(APITable):
         search_params = {}
         subset_where_conditions = []
         for op, arg1, arg2 in where_conditions:
-            if arg1 == 'inventory_item_ids':
-                if op == '=':
-                    search_params["inventory_item_ids"] = arg2
-                else:
-                    raise NotImplementedError("Only '=' operator is supported for inventory_item_ids column.")
-            elif arg1 == 'location_ids':
-                if op == '=':
-                    search_params["location_ids"] = arg2
-                else:
-                    raise NotImplementedError("Only '=' operator is supported for location_ids column.")
-            elif arg1 in ['available', 'updated_at']:
-                subset_where_conditions.append([op, arg1, arg2])
+            handle_condition = self.where_condition_handlers.get(arg1)
+            if handle_condition is not None:
+                handle_condition(op, arg1, arg2, search_params, subset_where_conditions)
 
         filter_flag = ("inventory_item_ids" in search_params) or ("location_ids" in search_params)
 
@@ -378,19 +568,12 @@ class InventoryLevelTable(APITable):
 
         search_params["limit"] = result_limit
 
-        inventory_df = pd.json_normalize(self.get_inventory(search_params))
+        # inventory levels are flat records
+        inventory_df = pd.DataFrame.from_records(self.get_inventory(search_params), columns=self._RESPONSE_COLUMNS)
 
         self.clean_selected_columns(selected_columns)
 
-        select_statement_executor = SELECTQueryExecutor(
-            inventory_df,
-            selected_columns,
-            subset_where_conditions,
-            order_by_conditions
-        )
-        inventory_df = select_statement_executor.execute_query()
-
-        return inventory_df
+        return execute_select(inventory_df, selected_columns, subset_where_conditions, order_by_conditions)
 
     def clean_selected_columns(self, selected_cols) -> List[Text]:
         if "inventory_item_ids" in selected_cols:
@@ -401,17 +584,18 @@ class InventoryLevelTable(APITable):
             selected_cols.append("location_id")
 
     def get_columns(self) -> List[Text]:
-        return ["inventory_item_ids", "location_ids", "available", "updated_at"]
+        # a new list every time: the parsed selected columns are modified by clean_selected_columns
+        return list(self._COLUMNS)
 
     def get_inventory(self, kwargs) -> List[Dict]:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
-        inventories = shopify.InventoryLevel.find(**kwargs)
-        return [inventory.to_dict() for inventory in inventories]
+        key = ResponseCache.make_key('inventory_level', kwargs)
+        return cached_find(self.handler, shopify.InventoryLevel, key, **kwargs)
 
-class LocationTable(APITable):
+class LocationTable(ResponseColumnsTable):
     """The Shopify Location Table implementation"""
 
+    table_name = 'locations'
+
     def select(self, query: ast.Select) -> pd.DataFrame:
         """Pulls data from the Shopify "GET /locations" API endpoint.
 
@@ -431,38 +615,24 @@ class LocationTable(APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        select_statement_parser = SELECTQueryParser(
-            query,
-            'locations',
-            self.get_columns()
-        )
-        selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
+        return super().select(query)
 
-        locations_df = pd.json_normalize(self.get_locations(limit=result_limit))
+    def get_records(self, **kwargs) -> List[Dict]:
+        return self.get_locations(**kwargs)
 
-        select_statement_executor = SELECTQueryExecutor(
-            locations_df,
-            selected_columns,
-            where_conditions,
-            order_by_conditions
-        )
-
-        locations_df = select_statement_executor.execute_query()
-
-        return locations_df
-
-    def get_columns(self) -> List[Text]:
-        return pd.json_normalize(self.get_locations(limit=1)).columns.tolist()
+    def records_to_df(self, records: List[Dict]) -> pd.DataFrame:
+        # locations have only flat top-level fields, nothing to normalize
+        return pd.DataFrame.from_records(records)
 
     def get_locations(self, **kwargs) -> List[Dict]:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
-        locations = shopify.Location.find(**kwargs)
-        return [location.to_dict() for location in locations]
+        key = ResponseCache.make_key('locations', kwargs)
+        return cached_find(self.handler, shopify.Location, key, **kwargs)
 
-class CustomerReviews(APITable):
+class CustomerReviews(ResponseColumnsTable):
     """The Shopify Customer Reviews Table implementation"""
 
+    table_name = 'customer_reviews'
+
     def select(self, query: ast.Select) -> pd.DataFrame:
         """Pulls data from the Yotpo "GET https://api.yotpo.com/v1/apps/{app_key}/reviews?utoken={utoken}" API endpoint.
 
@@ -482,43 +652,52 @@ class CustomerReviews(APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        select_statement_parser = SELECTQueryParser(
-            query,
-            'customer_reviews',
-            self.get_columns()
-        )
-        selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
+        return super().select(query)
 
-        customer_reviews_df = pd.json_normalize(self.get_customer_reviews(limit=result_limit))
-
-        select_statement_executor = SELECTQueryExecutor(
-            customer_reviews_df,
-            selected_columns,
-            where_conditions,
-            order_by_conditions
-        )
-
-        customer_reviews_df = select_statement_executor.execute_query()
-
-        return customer_reviews_df
-
-    def get_columns(self) -> List[Text]:
-        return pd.json_normalize(self.get_customer_reviews(limit=1)).columns.tolist()
+    def get_records(self, **kwargs) -> List[Dict]:
+        return self.get_customer_reviews(**kwargs)
 
     def get_customer_reviews(self, **kwargs) -> List[Dict]:
         if self.handler.yotpo_app_key is None or self.handler.yotpo_access_token is None:
             raise Exception("You need to provide 'yotpo_app_key' and 'yotpo_access_token' to retrieve customer reviews.")
-        url = f"https://api.yotpo.com/v1/apps/{self.handler.yotpo_app_key}/reviews?count=0&utoken={self.handler.yotpo_access_token}"
-        headers = {
-            "accept": "application/json",
-            "Content-Type": "application/json"
-        }
-        json_response = requests.get(url, headers=headers).json()
-        return [review for review in json_response['reviews']] if 'reviews' in json_response else []
+        url = f"https://api.yotpo.com/v1/apps/{self.handler.yotpo_app_key}/reviews"
+        limit = kwargs.get('limit')
+        page_size = min(limit, YOTPO_REVIEWS_PAGE_SIZE) if limit else YOTPO_REVIEWS_PAGE_SIZE
+
+        def fetch_page(page: int) -> List[Dict]:
+            params = {'utoken': self.handler.yotpo_access_token, 'count': page_size, 'page': page}
+            response = yotpo_session.get(url, params=params, timeout=YOTPO_REQUEST_TIMEOUT)
+            # a failed page would look like the last one and silently cut the reviews short
+            response.raise_for_status()
+            return response.json().get('reviews', [])
+
+        # the total number of reviews is not known upfront: the first page is requested alone,
+        # the next ones in concurrent batches until a page comes back incomplete or the limit is reached
+        reviews = []
+        next_page = 1
+        with ThreadPoolExecutor(max_workers=MAX_THREAD_POOL_WORKERS) as executor:
+            while True:
+                batch_size = 1 if next_page == 1 else MAX_THREAD_POOL_WORKERS
+                if limit:
+                    batch_size = min(batch_size, -(-(limit - len(reviews)) // page_size))
+                pages = range(next_page, next_page + batch_size)
+                next_page += batch_size
+
+                is_last_page = False
+                for page_reviews in executor.map(fetch_page, pages):
+                    reviews.extend(page_reviews)
+                    if len(page_reviews) < page_size:
+                        is_last_page = True
+                        break
+                if is_last_page or (limit and len(reviews) >= limit):
+                    break
+        return reviews[:limit] if limit else reviews
 
 class CarrierServiceTable(APITable):
     """The Shopify carrier service Table implementation. Example carrier services like usps, dhl etc."""
 
+    _COLUMNS = ("id", "name", "active", "service_discovery", "carrier_service_type", "admin_graphql_api_id")
+
     def select(self, query: ast.Select) -> pd.DataFrame:
         """Pulls data from the Shopify "GET /carrier_services" API endpoint.
 
@@ -545,24 +724,13 @@ class CarrierServiceTable(APITable):
         )
         selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
 
-        carrier_service_df = pd.json_normalize(self.get_carrier_service())
-
-        select_statement_executor = SELECTQueryExecutor(
-            carrier_service_df,
-            selected_columns,
-            where_conditions,
-            order_by_conditions
-        )
-        
-        carrier_service_df = select_statement_executor.execute_query()
+        carrier_service_df = pd.DataFrame.from_records(self.get_carrier_service(), columns=self._COLUMNS)
 
-        return carrier_service_df
+        return execute_select(carrier_service_df, selected_columns, where_conditions, order_by_conditions)
 
     def get_columns(self) -> List[Text]:
-        return ["id", "name", "active", "service_discovery", "carrier_service_type", "admin_graphql_api_id"]
+        return list(self._COLUMNS)
 
     def get_carrier_service(self) -> List[Dict]:
-        api_session = self.handler.connect()
-        shopify.ShopifyResource.activate_session(api_session)
-        services = shopify.CarrierService.find()
-        return [service.to_dict() for service in services]
\ No newline at end of file
+        key = ResponseCache.make_key('carrier_service', {})
+        return cached_find(self.handler, shopify.CarrierService, key)
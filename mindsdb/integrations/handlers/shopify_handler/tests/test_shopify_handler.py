@@ -0,0 +1,180 @@
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+import shopify
+
+from mindsdb.integrations.handlers.shopify_handler.shopify_handler import ShopifyHandler
+from mindsdb.integrations.handlers.shopify_handler.shopify_tables import (
+    ResponseCache, where_conditions_to_api_params, to_plain, yotpo_session
+)
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def test_get_set(self):
+        cache = ResponseCache()
+        key = ResponseCache.make_key('products', {'limit': 10, 'vendor': 'v'})
+        assert key == ResponseCache.make_key('products', {'vendor': 'v', 'limit': 10})
+        assert key != ResponseCache.make_key('customers', {'limit': 10, 'vendor': 'v'})
+
+        assert cache.get(key) is None
+        cache.set(key, [{'id': 1}])
+        assert cache.get(key) == [{'id': 1}]
+
+        cache.clear()
+        assert cache.get(key) is None
+
+    @patch('mindsdb.integrations.handlers.shopify_handler.shopify_tables.time.monotonic')
+    def test_ttl(self, mock_monotonic):
+        cache = ResponseCache(ttl=60)
+        mock_monotonic.return_value = 100
+        cache.set('a', [])
+        mock_monotonic.return_value = 160
+        assert cache.get('a') == []
+        mock_monotonic.return_value = 161
+        assert cache.get('a') is None
+
+    def test_max_size(self):
+        cache = ResponseCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+        # the oldest response is dropped
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+        assert cache.get('c') == 3
+
+
+class WhereConditionsToApiParamsTest(unittest.TestCase):
+
+    def test_api_params(self):
+        where_conditions = [
+            ['in', 'id', [1, 2]],
+            ['=', 'vendor', 'v'],
+            ['>', 'title', 'a'],
+            ['=', 'tags', 't'],
+        ]
+        params = where_conditions_to_api_params(where_conditions, supported_columns=['vendor', 'title'])
+        # only '=' on supported columns is sent, the rest is left to the query executor
+        assert params == {'ids': '1,2', 'vendor': 'v'}
+
+        assert where_conditions_to_api_params([['=', 'id', 3]], supported_columns=[]) == {'ids': '3'}
+        assert where_conditions_to_api_params([['>', 'id', 3]], supported_columns=[]) == {}
+
+
+class ToPlainTest(unittest.TestCase):
+
+    def test_to_plain(self):
+        handler = ShopifyHandler(
+            'test_shopify_handler',
+            connection_data={'shop_url': 'test.myshopify.com', 'access_token': 'test-token'}
+        )
+        handler.activate_session()
+
+        product = shopify.Product({
+            'id': 1,
+            'tags': ['a', 'b'],
+            'image': {'src': 's'},
+            'variants': [{'id': 2, 'option': {'x': 1}}]
+        })
+        assert isinstance(product.attributes['variants'][0], shopify.Variant)
+        expected = product.to_dict()
+
+        plain = to_plain(product)
+        assert plain == expected
+        assert type(plain['image']) is dict
+        assert type(plain['variants'][0]) is dict
+        assert type(plain['variants'][0]['option']) is dict
+        # the parsed attributes are reused, not copied
+        assert plain is product.attributes
+
+
+class ShopifyWritesTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.handler = ShopifyHandler(
+            'test_shopify_handler',
+            connection_data={'shop_url': 'test.myshopify.com', 'access_token': 'test-token'}
+        )
+
+    def test_cache_cleared_after_writes(self):
+        cache = self.handler.response_cache
+
+        def create(product):
+            # a select running during the writes caches the old state
+            cache.set('products', [])
+            return shopify.Product({'id': 1, **product})
+
+        with patch.object(shopify.Product, 'create', side_effect=create) as mock_create:
+            self.handler._tables['products'].create_products([{'title': 'a'}, {'title': 'b'}])
+
+        assert mock_create.call_count == 2
+        assert cache.get('products') is None
+
+
+class CustomerReviewsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.handler = ShopifyHandler(
+            'test_shopify_handler',
+            connection_data={'shop_url': 'test.myshopify.com', 'access_token': 'test-token'}
+        )
+        cls.handler.yotpo_app_key = 'test-key'
+        cls.handler.yotpo_access_token = 'test-token'
+
+    def get_reviews(self, total_reviews, failed_pages=(), **kwargs):
+        requested_pages = []
+        lock = threading.Lock()
+
+        def get(url, params=None, timeout=None):
+            with lock:
+                requested_pages.append((params['page'], params['count']))
+            start = (params['page'] - 1) * params['count']
+            response = MagicMock()
+            if params['page'] in failed_pages:
+                response.raise_for_status.side_effect = requests.exceptions.HTTPError('503 Server Error')
+            response.json.return_value = {
+                'reviews': [{'id': i} for i in range(start, min(start + params['count'], total_reviews))]
+            }
+            return response
+
+        with patch.object(yotpo_session, 'get', side_effect=get):
+            reviews = self.handler._tables['customer_reviews'].get_customer_reviews(**kwargs)
+        return reviews, sorted(requested_pages)
+
+    def test_all_pages(self):
+        reviews, pages = self.get_reviews(1000)
+        # pages are returned in order
+        assert [review['id'] for review in reviews] == list(range(1000))
+        # the first page alone, then batches until a short page
+        assert pages[:11] == [(page, 100) for page in range(1, 12)]
+
+        reviews, pages = self.get_reviews(50)
+        assert len(reviews) == 50
+        assert pages == [(1, 100)]
+
+        reviews, pages = self.get_reviews(0)
+        assert reviews == []
+        assert pages == [(1, 100)]
+
+    def test_limit(self):
+        reviews, pages = self.get_reviews(1000, limit=5)
+        assert [review['id'] for review in reviews] == list(range(5))
+        assert pages == [(1, 5)]
+
+        reviews, pages = self.get_reviews(1000, limit=150)
+        assert [review['id'] for review in reviews] == list(range(150))
+        assert pages == [(1, 100), (2, 100)]
+
+    def test_failed_page(self):
+        # the error is raised instead of returning the reviews of the first page only
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.get_reviews(1000, failed_pages=(2,))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1129,3 +1129,130 @@ class TestExecutionTools:
         ]
         df = pd.DataFrame(d)
         query_df(df, 'select * from models')
+
+    def test_query_df_training_options_filter(self):
+        df = pd.DataFrame([{'TRAINING_OPTIONS': {'b': {'x': 'A'}}}, {'TRAINING_OPTIONS': None}])
+        ret = query_df(df, 'select * from models where TRAINING_OPTIONS is not null')
+        assert len(ret) == 1
+
+    def test_query_df_training_options_input_not_modified(self):
+        df = pd.DataFrame([{'TRAINING_OPTIONS': {'b': 1}, 'NAME': 'm1'}])
+        query_df(df, 'select NAME from models')
+        assert df['TRAINING_OPTIONS'].dtype == object
+        assert df['TRAINING_OPTIONS'][0] == {'b': 1}
+
+    def test_query_df_select_all_matches_columns(self):
+        df = pd.DataFrame({
+            'i': [1, 2, 3],
+            'u': np.array([1, 2, 3], dtype='uint8'),
+            'f': [1.5, np.nan, 3.0],
+            'b': [True, False, True],
+            'ts': pd.to_datetime(['2020-01-01', None, '2020-01-03']),
+            'd': [dt.date(2020, 1, 1), dt.date(2020, 1, 2), None],
+            'o': [1, 'x', None],
+            'j': [{'a': 1}, [1, 2], None],
+            'ni': pd.array([1, None, 3], dtype='Int64'),
+            'cat': pd.Categorical(['a', 'b', 'a']),
+        }, index=[5, 6, 7])
+
+        # only numeric frame may skip duckdb, the mixed one has to go through it
+        for columns in (['i', 'u', 'f', 'b', 'ts'], list(df.columns)):
+            part = df[columns]
+            ret_all = query_df(part, 'select * from t')
+            ret_columns = query_df(part, f"select {', '.join(columns)} from t")
+
+            assert list(ret_all.columns) == columns
+            assert list(ret_all.index) == [0, 1, 2]
+            for column in columns:
+                values_all = ret_all[column].tolist()
+                values_columns = ret_columns[column].tolist()
+                assert values_all == values_columns
+                assert [type(v) for v in values_all] == [type(v) for v in values_columns]
+
+    def test_query_df_render_failback_cache(self):
+        # test setup may reload mindsdb modules: the query has to go through the patched module
+        from mindsdb.api.mysql.mysql_proxy.utilities import sql
+
+        df = pd.DataFrame([[1, 'x'], [2, 'y']], columns=['a', 'b'])
+
+        def get_string(query_ast, with_failback):
+            if not with_failback:
+                raise NotImplementedError()
+            return 'SELECT a FROM df_table WHERE a > 1'
+
+        query = 'select a from t where a > 1'
+        sql._failback_queries.discard(query)
+        with patch.object(sql._render, 'get_string', side_effect=get_string) as mock_get_string:
+            for _ in range(2):
+                ret = sql.query_df(df, query)
+                assert ret['a'].tolist() == [2]
+        # the second time the strict render isn't tried
+        assert mock_get_string.call_count == 2
+        assert query in sql._failback_queries
+        sql._failback_queries.discard(query)
+
+        # failback can't render the query: it isn't remembered and keeps raising
+        query = 'select b from t where a > 1'
+        with patch.object(sql._render, 'get_string', side_effect=AttributeError()):
+            for _ in range(2):
+                with pytest.raises(AttributeError):
+                    sql.query_df(df, query)
+        assert query not in sql._failback_queries
+
+    def test_query_df_json_columns(self):
+        df = pd.DataFrame({
+            'j': [{'a': 1}, [1, 2], '{"a": 3}', None],
+            'n': [1, 2, 3, 4]
+        })
+        ret = query_df(df, "select json_extract(j, '$.a') as a, j, n from t")
+
+        # dict and list cells are encoded to json, other values are kept
+        assert ret['j'].tolist() == ['{"a": 1}', '[1, 2]', '{"a": 3}', None]
+        assert ret['a'].tolist() == ['1', None, '3', None]
+        assert ret['n'].tolist() == [1, 2, 3, 4]
+
+    def test_query_df_duckdb_connection(self):
+        import threading
+        import duckdb
+        # test setup may reload mindsdb modules: the query and the connection have to come from the same module
+        from mindsdb.api.mysql.mysql_proxy.utilities import sql
+
+        df = pd.DataFrame([[1, 'x'], [2, 'y']], columns=['a', 'b'])
+        sql.query_df(df, 'select a from t')
+        con = sql._get_duckdb_connection()
+
+        # the query fails in duckdb: the frame is unregistered anyway
+        with pytest.raises(duckdb.Error):
+            sql.query_df(df, 'select not_exists from t')
+        with pytest.raises(duckdb.CatalogException):
+            con.execute('select * from df_table')
+
+        # the connection is reused within the thread and isn't shared with other threads
+        assert sql.query_df(df, 'select a from t where a > 1')['a'].tolist() == [2]
+        assert sql._get_duckdb_connection() is con
+
+        thread_connections = []
+        thread = threading.Thread(target=lambda: thread_connections.append(sql._get_duckdb_connection()))
+        thread.start()
+        thread.join()
+        assert thread_connections[0] is not con
+
+    def test_query_df_nulls(self):
+        df = pd.DataFrame({
+            'n': [1, 2, 3],
+            'f': [1.5, 2.5, 3.5],
+            'fn': [1.5, np.nan, 3.5],
+            'ts': pd.to_datetime(['2020-01-01', None, '2020-01-03']),
+            's': ['a', None, 'c'],
+        })
+        ret = query_df(df, 'select n, f, fn, ts, s from t where n > 0')
+
+        # columns without NULLs keep their dtype
+        assert ret['n'].dtype == np.int64
+        assert ret['f'].dtype == np.float64
+
+        # NaN and NaT are returned as None
+        assert ret['fn'].tolist() == [1.5, None, 3.5]
+        assert ret['ts'][1] is None
+        assert ret['ts'][0] == pd.Timestamp('2020-01-01')
+        assert ret['s'].tolist() == ['a', None, 'c']